@@ -1,11 +1,34 @@
+import importlib
+import typing
+
 from .utils.repr import set_value_repr
 from .utils.exceptions import set_deep_exception_traceback
-from .validators import ValidatorMixin
-from .sub_fields_validator import CheckFieldsMixin
+
+if typing.TYPE_CHECKING:
+    from .validators import ValidatorMixin
+    from .sub_fields_validator import CheckFieldsMixin
 
 __all__ = [
     "set_value_repr",
     "set_deep_exception_traceback",
     "ValidatorMixin",
     "CheckFieldsMixin",
-]
\ No newline at end of file
+]
+
+# mixins are imported on first access, so importing the package does not load validation machinery
+_LAZY_IMPORTS = {
+    "ValidatorMixin": ".validators",
+    "CheckFieldsMixin": ".sub_fields_validator",
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
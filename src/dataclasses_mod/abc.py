@@ -36,6 +36,36 @@ class MissingField(dataclasses.Field):
     def __repr__(self):
         return "Missing" + super().__repr__()
 
+    @classmethod
+    def create(cls, related_cls: type, field: dataclasses.Field | None = None) -> "MissingField":
+        """
+        Create stub field of related class, optionally based on field without default value.
+        """
+        if field is None:
+            result = cls(
+                default=dataclasses.MISSING,
+                default_factory=dataclasses.MISSING,
+                init=True,
+                repr=False,
+                hash=None,
+                compare=False,
+                metadata=None,
+                kw_only=dataclasses.MISSING
+            )
+        else:
+            result = cls(
+                default=dataclasses.MISSING,
+                default_factory=field.default_factory,
+                init=field.init,
+                repr=field.repr,
+                hash=field.hash,
+                compare=field.compare,
+                metadata=field.metadata,
+                kw_only=field.kw_only,
+            )
+        result.related_cls = related_cls
+        return result
+
     def __get__(self, instance: object, owner: type):
         if instance is None:
             return self
@@ -47,7 +77,9 @@ class MissingField(dataclasses.Field):
 
     @property
     def default(self):
-        if self.name is not None and isinstance(self.related_cls.__dict__[self.name], _Descriptor):
+        # not cached: the result changes when dataclass decorator replaces this field by the descriptor,
+        # it makes the attribute required in __init__
+        if self.name is not None and type(self.related_cls.__dict__[self.name]) is _Descriptor:
             return dataclasses.MISSING
         return _Descriptor(self.name)
 
@@ -115,22 +147,31 @@ class ABC(_ABC):
     """
 
     def __new__(cls, *args, **kwargs):
-        if dataclasses.is_dataclass(cls):
-            abstract_fields = [
-                i.name for i in dataclasses.fields(cls)
-                if isinstance(i, AbsField) and (
-                        i.name not in cls.__dict__ or isinstance(cls.__dict__[i.name], (AbsField, _Descriptor))
-                )
-            ]
-            if len(abstract_fields) == 1:
-                raise TypeError(f"Can't instantiate abstract class {cls.__qualname__} "
-                                f"with abstract field {abstract_fields[0]}")
-            if len(abstract_fields) > 1:
-                fields = ", ".join(repr(i) for i in abstract_fields)
-                raise TypeError(f"Can't instantiate abstract class {cls.__qualname__} "
-                                f"with abstract fields {fields}")
+        # abstract fields are known only after dataclass decorator is applied,
+        # so they are collected on the first instantiation of the class
+        abstract_fields = cls.__dict__.get("__abstract_fields__")
+        if abstract_fields is None:
+            abstract_fields = cls.__abstract_fields__ = cls._collect_abstract_fields()
+        if len(abstract_fields) == 1:
+            raise TypeError(f"Can't instantiate abstract class {cls.__qualname__} "
+                            f"with abstract field {abstract_fields[0]}")
+        if len(abstract_fields) > 1:
+            fields = ", ".join(repr(i) for i in abstract_fields)
+            raise TypeError(f"Can't instantiate abstract class {cls.__qualname__} "
+                            f"with abstract fields {fields}")
         return super().__new__(cls)
 
+    @classmethod
+    def _collect_abstract_fields(cls) -> tuple[str, ...]:
+        if not dataclasses.is_dataclass(cls):
+            return ()
+        return tuple(
+            i.name for i in dataclasses.fields(cls)
+            if isinstance(i, AbsField) and (
+                    i.name not in cls.__dict__ or isinstance(cls.__dict__[i.name], (AbsField, _Descriptor))
+            )
+        )
+
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
         abstracts = set()
@@ -138,7 +179,6 @@ class ABC(_ABC):
         # that are not implemented.
         for scls in cls.__bases__:
             for name in getattr(scls, '__abstractmethods__', ()):
-                value = getattr(cls, name, None)
                 value = getattr(scls, name, None)
                 if getattr(value, "__isabstractmethod__", False):
                     abstracts.add(name)
@@ -154,34 +194,9 @@ class ABC(_ABC):
             )):
                 continue
 
-            if field not in cls.__dict__:
-                f = MissingField(
-                    default=dataclasses.MISSING,
-                    default_factory=dataclasses.MISSING,
-                    init=True,
-                    repr=False,
-                    hash=None,
-                    compare=False,
-                    metadata=None,
-                    kw_only=dataclasses.MISSING
-                )
-                f.related_cls = cls
-                setattr(cls, field, f)
-                continue
-            field_value = cls.__dict__[field]
-            if isinstance(field_value, dataclasses.Field):
-                if field_value.default is dataclasses.MISSING:
-                    f = MissingField(
-                        default=dataclasses.MISSING,
-                        default_factory=field_value.default_factory,
-                        init=field_value.init,
-                        repr=field_value.repr,
-                        hash=field_value.hash,
-                        compare=field_value.compare,
-                        metadata=field_value.metadata,
-                        kw_only=field_value.kw_only,
-                    )
-                    f.related_cls = cls
-                    setattr(cls, field, f)
-                    continue
+            field_value = cls.__dict__.get(field, dataclasses.MISSING)
+            if field_value is dataclasses.MISSING:
+                setattr(cls, field, MissingField.create(cls))
+            elif isinstance(field_value, dataclasses.Field) and field_value.default is dataclasses.MISSING:
+                setattr(cls, field, MissingField.create(cls, field_value))
         # class is prepared to process by dataclass decorator
@@ -1,9 +1,13 @@
 import enum
+import itertools
 import logging
+import operator
+import sys
 import typing
 
-from dataclasses_mod.utils.attrs import get_deep_attr
-from dataclasses_mod.utils.repr import value_repr, log_value_repr
+from dataclasses_mod.utils.attrs import get_deep_attrs
+from dataclasses_mod.utils.cache import cache_hashable
+from dataclasses_mod.utils.repr import value_repr, LazyValueRepr
 
 logger = logging.getLogger(__name__)
 
@@ -35,69 +39,62 @@ S_S_ELEMENT = S_S_ELEMENT_2[S_S_ELEMENT_1[S_S_ELEMENT_0]]
 S_SCHEMA = S_TUPLE[S_S_ELEMENT]
 
 
-def _j_keys(a: str, b: str) -> str:
-    if not a:
-        return b
-    if not b:
-        return a
-    if a.endswith("."):
-        return a + b
-    return a + "." + b
-
-
-def _element_schema_compile(field_schema: SCHEMA) -> list[tuple[str, str]]:
-    result = []
-    for key, value in field_schema.items():
-        if isinstance(value, str):
-            result.append((key, value))
-        elif isinstance(value, dict):
-            for sub_key, cmp_key in _element_schema_compile(value):
-                result.append((_j_keys(key, sub_key), cmp_key))
-        elif isinstance(value, tuple):
-            assert all(isinstance(v, str) for v in value), "Expect a tuple of string"
-            result += [(key, v) for v in value]
-        else:
-            typing.assert_never(type(value))
-    return result
-
-
-def _schema_compile(schema: SCHEMA) -> list[tuple[str, str]]:
+def _schema_compile(schema: SCHEMA) -> tuple[tuple[str, str], ...]:
     if not isinstance(schema, tuple):
         schema = (schema,)
-    result = typing.cast(list[tuple[str, str]], [])
+    result = []
     for item in schema:
-        result += _element_schema_compile(item)
-    return result
-
-
-def _element_s_schema_compile(field_schema: str | dict) -> list[str]:
-    if isinstance(field_schema, str):
-        return [field_schema]
-
-    if isinstance(field_schema, dict):
-        result = []
-        for key, val in field_schema.items():
-            result += [_j_keys(key, i) for i in _element_s_schema_compile(val)]
-        return result
-
-    assert isinstance(field_schema, (list, tuple)), "Unexpected type of fields"
-    assert all(isinstance(i, str) for i in field_schema), ""
-    return [str(i) for i in field_schema]
-
-
-def _s_schema_compile(schema: S_SCHEMA) -> list[str]:
-    if isinstance(schema, str):
-        return [schema]
-    if isinstance(schema, (tuple, list)) and all(isinstance(i, str) for i in schema):
-        return list(schema)
-    if isinstance(schema, dict):
-        result = []
-        for key, value in schema.items():
-            result.extend(_j_keys(key, i) for i in _element_s_schema_compile(value))
-        return result
-    assert isinstance(schema, (list, tuple)), "Invalid schema type"
-    return sum((_s_schema_compile(i) for i in schema), [])
-
+        # stack of (prefix, iterator over items of dict), walk is in the order of definition
+        stack = [("", iter(item.items()))]
+        while stack:
+            prefix, items = stack[-1]
+            for key, value in items:
+                # keys are joined in canonical form without trailing dot, empty key is an empty prefix
+                key = key.rstrip(".")
+                key = f"{prefix}.{key}" if prefix and key else prefix or key
+                if isinstance(value, str):
+                    result.append((key, value))
+                elif isinstance(value, dict):
+                    stack.append((key, iter(value.items())))
+                    break
+                elif isinstance(value, tuple):
+                    assert all(isinstance(v, str) for v in value), "Expect a tuple of string"
+                    result.extend((key, v) for v in value)
+                else:
+                    typing.assert_never(type(value))
+            else:
+                stack.pop()
+    return tuple((sys.intern(key), sys.intern(value)) for key, value in result)
+
+
+@cache_hashable()
+def _s_schema_compile(schema: S_SCHEMA) -> tuple[str, ...]:
+    result = []
+    # stack of (prefix, iterator over (key, element), is inside dict), walk is in the order of definition
+    stack = [("", iter((("", schema),)), False)]
+    while stack:
+        prefix, items, in_dict = stack[-1]
+        for key, value in items:
+            # keys are joined in canonical form without trailing dot, empty key is an empty prefix
+            key = key.rstrip(".")
+            key = f"{prefix}.{key}" if prefix and key else prefix or key
+            if isinstance(value, str):
+                result.append(f"{key}.{value}" if key and value else key or value)
+            elif isinstance(value, dict):
+                stack.append((key, iter(value.items()), True))
+                break
+            elif in_dict:
+                assert isinstance(value, (list, tuple)), "Unexpected type of fields"
+                assert all(isinstance(i, str) for i in value), ""
+                result.extend(f"{key}.{i}" if key and i else key or str(i) for i in value)
+            else:
+                assert isinstance(value, (list, tuple)), "Invalid schema type"
+                stack.append((key, (("", i) for i in value), False))
+                break
+        else:
+            stack.pop()
+    # each path is compared once
+    return tuple(sys.intern(i) for i in dict.fromkeys(result))
 
 
 class CheckFieldsMixin:
@@ -111,25 +108,30 @@ class CheckFieldsMixin:
         :return: None
         :raise ValueError: when field schema is not satisfied with other
         """
-        logger.info("Check same fields against %s", log_value_repr(other, logging.INFO, logger))
+        logger.info("Check same fields against %s", LazyValueRepr(other, logging.INFO, logger))
         compiled_schema = _s_schema_compile(fields)
-
-        diff = {}
-        for item in compiled_schema:
-            logger.debug("Compare %s", item)
-            self_value = get_deep_attr(self, item)
-            other_value = get_deep_attr(other, item)
-            if self_value != other_value:
-                logger.debug("Found different at %s", item)
-                diff[item] = (self_value, other_value)
+        is_debug = logger.isEnabledFor(logging.DEBUG)
+
+        self_values = get_deep_attrs(self, compiled_schema)
+        other_values = get_deep_attrs(other, compiled_schema)
+        if is_debug:
+            logger.debug("Compare %s", ", ".join(compiled_schema))
+        # values are compared pairwise by C-level loop, only indexes of different values are collected,
+        # paths of compiled schema are unique, so indexes identify differences
+        diff = list(itertools.compress(itertools.count(), map(operator.ne, self_values, other_values)))
+        if is_debug:
+            for idx in diff:
+                logger.debug("Found different at %s", compiled_schema[idx])
 
         logger.debug("Found %s diffs", len(diff))
         if not diff:
             return
-        k_length = max(len(i) for i in diff)
+        diff.sort(key=compiled_schema.__getitem__)
+        k_length = max(len(compiled_schema[idx]) for idx in diff)
         lines = []
-        for k, (s_value, o_value) in sorted(diff.items(), key=lambda v: v[0]):
-            lines.append(f"      {k.rjust(k_length)}: {value_repr(s_value)} -> {value_repr(o_value)}")
+        for idx in diff:
+            lines.append(f"      {compiled_schema[idx]:>{k_length}}: "
+                         f"{value_repr(self_values[idx])} -> {value_repr(other_values[idx])}")
         table = "\n".join(lines)
         raise ValueError(f"Found unexpected difference {self} -> {other}:\n{table}")
 
@@ -142,27 +144,31 @@ class CheckFieldsMixin:
         :return: None
         :raise ValueError: when field schema is not satisfied with other
         """
-        logger.info("Check another fields against %s", log_value_repr(other, logging.INFO, logger))
-        diff = []
-
+        logger.info("Check another fields against %s", LazyValueRepr(other, logging.INFO, logger))
         compiled_schema = _schema_compile(field_schema)
-        for self_attr, other_attr in compiled_schema:
-            logger.debug("Compare %s to %s", self_attr, other_attr)
-            self_value = get_deep_attr(self, self_attr)
+        is_debug = logger.isEnabledFor(logging.DEBUG)
+
+        self_values = get_deep_attrs(self, [self_attr for self_attr, _ in compiled_schema])
+        other_values = get_deep_attrs(other, [other_attr for _, other_attr in compiled_schema])
+        diff = []
+        k_length = 5
+        for (self_attr, other_attr), self_value, other_value in zip(compiled_schema, self_values, other_values):
+            if is_debug:
+                logger.debug("Compare %s to %s", self_attr, other_attr)
             self_cmp_value = self_value.value if isinstance(self_value, enum.Enum) else self_value
-            other_value = get_deep_attr(other, other_attr)
             other_cmp_value = other_value.value if isinstance(other_value, enum.Enum) else other_value
             if self_cmp_value != other_cmp_value:
-                logger.debug("Found diff of %s to %s", self_attr, other_attr)
+                if is_debug:
+                    logger.debug("Found diff of %s to %s", self_attr, other_attr)
                 diff.append((self_attr, other_attr, self_value, other_value))
+                k_length = max(k_length, len(self_attr) + len(other_attr) + 4)
         logger.debug("Found %s diffs", len(diff))
         if not diff:
             return
-
-        k_length = max(max(len(i[0]) + len(i[1]) + 4 for i in diff), 5)
+        diff.sort(key=operator.itemgetter(0, 1))
         lines = []
-        for key, o_key, s_value, o_value in sorted(diff, key=lambda v: (v[0], v[1])):
+        for key, o_key, s_value, o_value in diff:
             k = f"{key} -> {o_key}"
-            lines.append(f"    {k.rjust(k_length)}: {value_repr(s_value)} -> {value_repr(o_value)}")
+            lines.append(f"    {k:>{k_length}}: {value_repr(s_value)} -> {value_repr(o_value)}")
         table = "\n".join(lines)
         raise ValueError(f"Found unexpected difference {self} -> {other}:\n{table}")
\ No newline at end of file
@@ -1,3 +1,4 @@
+import functools
 import typing
 from logging import getLogger
 
@@ -7,27 +8,96 @@ logger = getLogger(__name__)
 logger.disabled = True
 
 
-def get_deep_attr(value, path: str):
+@functools.lru_cache(maxsize=4096)
+def _compile_path(path: str) -> tuple[tuple[str, int | None], ...]:
+    """
+    Split path into steps once.
+
+    :return: tuple of steps, each step is an attribute name (or key) and an index if the element is an integer
+    """
     if path == "." or not path:
-        return value
-    prefix = []
-    for attr in (path.split(".") if "." in path else [path]):
+        return ()
+    steps = []
+    for attr in path.split("."):
         assert attr, f"Empty element in path {path}"
-        prefix.append(attr)
-        if isinstance(value, typing.Mapping):
-            value = value[attr]
-            continue
-        if isinstance(value, typing.Sequence):
-            try:
-                attr = int(attr)
-            except ValueError:
-                raise AssertionError(f"Expect int as index, got {value!r} in path {path}")
-            try:
-                value = value[attr]
-            except IndexError:
-                raise AssertionError(f"Out of index of path {'.'.join(prefix)}")
-            continue
-        if not hasattr(value, attr):
-            raise AssertionError(f"Expect attribute {attr} of path {path} but not found in {value_repr(value)}")
-        value = getattr(value, attr)
+        try:
+            index = int(attr)
+        except ValueError:
+            index = None
+        steps.append((attr, index))
+    return tuple(steps)
+
+
+def _get_index(value: typing.Sequence, index: int | None, path: str, step: int):
+    if index is None:
+        raise AssertionError(f"Expect int as index, got {value!r} in path {path}")
+    try:
+        return value[index]
+    except IndexError:
+        prefix = ".".join(attr for attr, _ in _compile_path(path)[:step + 1])
+        raise AssertionError(f"Out of index of path {prefix}")
+
+
+# how a path element is applied to a value of some type
+_STEP_ATTRIBUTE = 0
+_STEP_KEY = 1
+_STEP_INDEX = 2
+
+
+@functools.lru_cache(maxsize=1024)
+def _step_kind(value_type: type) -> int:
+    # isinstance against typing.Mapping/Sequence is slow, especially for plain objects (the most common case),
+    # the result only depends on the type of value
+    if issubclass(value_type, typing.Mapping):
+        return _STEP_KEY
+    if issubclass(value_type, typing.Sequence):
+        return _STEP_INDEX
+    return _STEP_ATTRIBUTE
+
+
+def _get_step(value, attr: str, index: int | None, path: str, step: int):
+    kind = _step_kind(type(value))
+    if kind == _STEP_ATTRIBUTE:
+        try:
+            return getattr(value, attr)
+        except AttributeError:
+            raise AssertionError(
+                f"Expect attribute {attr} of path {path} but not found in {value_repr(value)}"
+            ) from None
+    if kind == _STEP_KEY:
+        return value[attr]
+    return _get_index(value, index, path, step)
+
+
+def get_deep_attr(value, path: str):
+    for step, (attr, index) in enumerate(_compile_path(path)):
+        value = _get_step(value, attr, index, path, step)
     return value
+
+
+def get_deep_attrs(value, paths: typing.Iterable[str]) -> list:
+    """
+    Get values of several deep attributes of the same object.
+
+    Common prefixes of paths are resolved only once, e.g. `a.b` for paths `a.b.c` and `a.b.d`.
+
+    :param value: root object
+    :param paths: paths related to the root object
+    :return: list of values in the order of paths
+    """
+    # trie of resolved prefixes: step -> (value, sub-trie)
+    resolved = {}
+    result = []
+    for path in paths:
+        node = resolved
+        current = value
+        for step, (attr, index) in enumerate(_compile_path(path)):
+            cached = node.get(attr)
+            if cached is None:
+                current = _get_step(current, attr, index, path, step)
+                cached = node[attr] = (current, {})
+            else:
+                current = cached[0]
+            node = cached[1]
+        result.append(current)
+    return result
@@ -0,0 +1,74 @@
+import functools
+import threading
+import typing
+
+T = typing.TypeVar('T')
+R = typing.TypeVar('R')
+
+
+def cache_by_id(maxsize: int = 256) -> typing.Callable[[typing.Callable[[T], R]], typing.Callable[[T], R]]:
+    """
+    Cache results of one-argument function by identity of argument.
+
+    It is intended for immutable arguments that have unsuitable equality (type hints: `int | str == str | int`)
+    and are defined once and reused, e.g. as dataclass annotations.
+    The argument is kept in the cache together with the result, so its id can not be reused by another object.
+    The oldest entry is dropped when the cache is full.
+
+    Note: the argument must be immutable, use `cache_hashable` for arguments that may be mutable containers.
+
+    :param maxsize: maximum number of cached results
+    """
+
+    def decorator(func: typing.Callable[[T], R]) -> typing.Callable[[T], R]:
+        cache: dict[int, tuple[T, R]] = {}
+        # function may be called recursively, so it is called outside the lock, only the cache update is locked
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(arg: T) -> R:
+            cached = cache.get(id(arg))
+            if cached is not None and cached[0] is arg:
+                return cached[1]
+            result = func(arg)
+            with lock:
+                if len(cache) >= maxsize:
+                    del cache[next(iter(cache))]
+                cache[id(arg)] = (arg, result)
+            return result
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
+def cache_hashable(maxsize: int = 256) -> typing.Callable[[typing.Callable[[T], R]], typing.Callable[[T], R]]:
+    """
+    Cache results of one-argument function by equality of argument when argument is hashable.
+
+    Hashable arguments (strings, tuples of strings) are immutable, so results can be reused.
+    Unhashable arguments (dict, list) may be changed between calls, results for them are not cached.
+
+    :param maxsize: maximum number of cached results
+    """
+
+    def decorator(func: typing.Callable[[T], R]) -> typing.Callable[[T], R]:
+        cached_func = functools.lru_cache(maxsize=maxsize)(func)
+
+        @functools.wraps(func)
+        def wrapper(arg: T) -> R:
+            try:
+                hash(arg)
+            except TypeError:
+                return func(arg)
+            return cached_func(arg)
+
+        wrapper.cache_clear = cached_func.cache_clear
+        return wrapper
+
+    return decorator
@@ -1,5 +1,4 @@
 import contextlib
-import dataclasses
 import typing
 import logging
 
@@ -28,29 +27,50 @@ def add_exception_notes(exc: Exception | None, *notes: str) -> Exception | None:
     return exc
 
 
-@dataclasses.dataclass
 class ExceptionCollector:
+    __slots__ = ("exc_list", )
 
-    exc_list: list[Exception] = dataclasses.field(default_factory=list)
+    exc_list: list[Exception]
+
+    def __init__(self):
+        self.exc_list = []
+
+    def __repr__(self):
+        return f"{type(self).__name__}(exc_list={self.exc_list!r})"
 
     @contextlib.contextmanager
     def __call__(self, *notes: str) -> Exception | None:
         try:
             yield
-        except (ValueError, TypeError) as exc:
+        except (ValueError, TypeError, ExceptionGroup) as exc:
+            self._add_caught(exc, notes)
+
+    def _add_caught(self, exc: Exception, notes: tuple[str, ...]):
+        if isinstance(exc, ExceptionGroup) and not exc.message and not getattr(exc, "__notes__", None):
+            self.extend((i, *notes) for i in exc.exceptions)
+        else:
             self.add(exc, *notes)
-        except ExceptionGroup as exc:
-            if not exc.message and not getattr(exc, "__notes__", None):
-                self.extend((i, *notes) for i in exc.exceptions)
-            else:
-                self.add(exc, *notes)
+
+    def add_raised(self, exc: Exception | None, *notes: str) -> typing.Self:
+        """
+        Add exception as if it was raised inside collector context, it allows to avoid raise and catch.
+        Exceptions that are not caught by collector context are raised.
+        """
+        if exc is None:
+            return self
+        if not isinstance(exc, (ValueError, TypeError, ExceptionGroup)):
+            raise exc
+        self._add_caught(exc, notes)
+        return self
 
     def add(self, exc: Exception | None, *notes: str) -> typing.Self:
-        exc = add_exception_notes(exc, *notes)
-        if exc is not None:
-            if _clean_traceback:
-                exc = exc.with_traceback(None)
-            self.exc_list.append(exc)
+        if exc is None:
+            return self
+        for item in notes:
+            exc.add_note(item)
+        if _clean_traceback:
+            exc = exc.with_traceback(None)
+        self.exc_list.append(exc)
         return self
 
     def extend(self, exc_list: typing.Iterable[EXC_WITH_NOTES | Exception]) -> typing.Self:
@@ -20,6 +20,24 @@ def log_value_repr(value, level, log: logging.Logger) -> str:
     return "-"
 
 
+class LazyValueRepr:
+    """
+    Value repr for log messages, it's rendered only if a message is emitted and only once.
+    """
+    __slots__ = ("value", "level", "log", "_repr")
+
+    def __init__(self, value, level, log: logging.Logger):
+        self.value = value
+        self.level = level
+        self.log = log
+        self._repr = None
+
+    def __str__(self):
+        if self._repr is None:
+            self._repr = log_value_repr(self.value, self.level, self.log)
+        return self._repr
+
+
 def set_value_repr(repr_function: typing.Callable[[...], str] = None):
     """
     Use provided function to repr values in exception and logs.
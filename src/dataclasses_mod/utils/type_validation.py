@@ -1,80 +1,237 @@
+import functools
+import itertools
 import logging
 import types
 import typing
 
-from .exceptions import ExceptionCollector, add_exception_notes
+from .cache import cache_by_id
+from .exceptions import add_exception_notes
 from .repr import value_repr, type_str
 
 logger = logging.getLogger(__name__)
 
+# compiled validator: (value, with_notes) -> exception or None
+TypeValidator = typing.Callable[[typing.Any, bool], Exception | None]
 
-def _validate_list(value, args: tuple) -> Exception | None:
+
+def _value_notes(value, with_notes: bool) -> tuple[str, ...]:
+    return (f"value {value_repr(value)}", ) if with_notes else ()
+
+
+def _validate_any(value, with_notes: bool = True) -> Exception | None:
+    return None
+
+
+def _validate_none(value, with_notes: bool = True) -> Exception | None:
+    if value is not None:
+        return add_exception_notes(TypeError(f"expect None"), *_value_notes(value, with_notes))
+    return None
+
+
+def _validate_class(type_descr: type, value, with_notes: bool = True) -> Exception | None:
+    # exact type is the common case, isinstance keeps instances of subclasses valid
+    if type(value) is type_descr:
+        return None
+    if not isinstance(value, type_descr):
+        return add_exception_notes(
+            TypeError(f"expect {type_descr.__name__}, got {type(value).__name__ if value is not None else None}"),
+            *_value_notes(value, with_notes),
+        )
+    return None
+
+
+def _validate_union(type_descr, exact_types: frozenset[type] | None, classes: tuple[type, ...] | None,
+                    validators: tuple[TypeValidator, ...], value, with_notes: bool = True) -> Exception | None:
+    # union of plain classes is checked by a lookup of exact type and by one C-level isinstance for subclasses,
+    # validators build errors on failure
+    if classes is not None and (type(value) in exact_types or isinstance(value, classes)):
+        return None
+    exc_list = []
+    for validator in validators:
+        exc = validator(value, False)
+        if exc is None:
+            return None
+        exc_list.append(exc)
+    return add_exception_notes(ExceptionGroup(f"expect {type_descr}", exc_list), *_value_notes(value, with_notes))
+
+
+def _exact_types(item_class: type | tuple[type, ...] | None) -> frozenset[type] | None:
+    # a lookup of exact type pays off only for unions, isinstance of one class is as fast
+    return frozenset(item_class) if isinstance(item_class, tuple) else None
+
+
+def _all_instances(value: typing.Iterable, exact_types: frozenset[type] | None,
+                   item_class: type | tuple[type, ...] | None) -> bool:
+    """
+    Check if all items are instances of class (or one of classes) by C-level loop,
+    it's a fast path for collections of plain classes.
+
+    Exact types of items of union are looked up in a set first, instances of subclasses are checked by isinstance.
+    """
+    if item_class is None:
+        return False
+    if exact_types is not None and exact_types.issuperset(map(type, value)):
+        return True
+    return all(map(isinstance, value, itertools.repeat(item_class)))
+
+
+def _validate_list(item_type, exact_types: frozenset[type] | None, item_class: type | tuple[type, ...] | None,
+                   validator: TypeValidator, value, with_notes: bool = True) -> Exception | None:
     if not isinstance(value, list):
         return TypeError(f"expect list, got {type(value).__name__ if value is not None else None}")
-    assert len(args) == 1, "Expect only one element in list specification"
-    collector = ExceptionCollector()
-    collector.extend((validate_type(item, args[0]), f"index {idx}") for idx, item in enumerate(value))
-    return collector.group_exception(f"expect list of {type_str(args[0])}")
+    if _all_instances(value, exact_types, item_class):
+        return None
+    # exceptions are collected only on failure, success is the common case
+    exc_list = None
+    for idx, item in enumerate(value):
+        exc = validator(item, True)
+        if exc is not None:
+            exc.add_note(f"index {idx}")
+            exc_list = exc_list or []
+            exc_list.append(exc)
+    return ExceptionGroup(f"expect list of {type_str(item_type)}", exc_list) if exc_list else None
 
 
-def _validate_set(value, args) -> Exception | None:
+def _validate_set(item_type, exact_types: frozenset[type] | None, item_class: type | tuple[type, ...] | None,
+                  validator: TypeValidator, value, with_notes: bool = True) -> Exception | None:
     if not isinstance(value, set):
         return TypeError(f"expect set, got {type(value).__name__ if value is not None else None}")
-    assert len(args) == 1, "Expect only one element in set specification"
-    return ExceptionCollector().extend((validate_type(item, args[0]), ) for item in value) \
-        .group_exception(f"expect {type_str(args[0])}")
+    if _all_instances(value, exact_types, item_class):
+        return None
+    exc_list = None
+    for item in value:
+        exc = validator(item, True)
+        if exc is not None:
+            exc_list = exc_list or []
+            exc_list.append(exc)
+    return ExceptionGroup(f"expect {type_str(item_type)}", exc_list) if exc_list else None
 
 
-def _validate_tuple(value, args) -> Exception | None:
+def _validate_empty_tuple(value, with_notes: bool = True) -> Exception | None:
     if not isinstance(value, tuple):
         return TypeError(f"expect tuple, got {type(value).__name__ if value is not None else None}")
-    if args == ():
-        if len(value) > 0:
-            return ValueError(f"expect empty tuple, got {len(value)} elements")
+    if len(value) > 0:
+        return ValueError(f"expect empty tuple, got {len(value)} elements")
+    return None
+
+
+def _validate_tuple(args: tuple, exact_types: frozenset[type] | None, item_class: type | tuple[type, ...] | None,
+                    validators: tuple[TypeValidator, ...], value, with_notes: bool = True) -> Exception | None:
+    """
+    :param exact_types: types of items of variadic tuple of union for a lookup of exact type
+    :param item_class: class (or classes) of items of variadic tuple,
+        tuple of classes (or tuples of classes) by position of fixed tuple, it's used for isinstance fast path
+    """
+    if not isinstance(value, tuple):
+        return TypeError(f"expect tuple, got {type(value).__name__ if value is not None else None}")
+    is_variadic = args[-1] is Ellipsis
+    if is_variadic and _all_instances(value, exact_types, item_class):
         return None
-    if args[-1] == Ellipsis:
-        assert len(args) == 2, "Expect one type in tuple specification with ellipsis"
-        return ExceptionCollector().extend(
-            (validate_type(item, args[0]),  f"index {idx}") for idx, item in enumerate(value)
-        ).group_exception(f"expect tuple of {type_str(args[0])}")
-    if len(args) != len(value):
+    if not is_variadic and len(args) != len(value):
         return ValueError(f"expect {len(args)} elements in tuple, got {len(value)} elements")
-    return ExceptionCollector().extend(
-        (validate_type(item, args[idx]), f"index {idx}") for idx, item in enumerate(value)
-    ).group_exception(f"expect tuple[{', '.join(type_str(i) for i in args)}]")
+    if not is_variadic and item_class is not None and all(map(isinstance, value, item_class)):
+        return None
+    exc_list = None
+    for idx, (item, validator) in enumerate(zip(value, itertools.repeat(validators[0]) if is_variadic else validators)):
+        exc = validator(item, True)
+        if exc is not None:
+            exc.add_note(f"index {idx}")
+            exc_list = exc_list or []
+            exc_list.append(exc)
+    if not exc_list:
+        return None
+    if is_variadic:
+        return ExceptionGroup(f"expect tuple of {type_str(args[0])}", exc_list)
+    return ExceptionGroup(f"expect tuple[{', '.join(type_str(i) for i in args)}]", exc_list)
 
 
-def validate_type(value, type_descr, _with_notes: bool = True) -> Exception | None:
-    logger.debug("Validate type %s", type_descr)
-    notes = (f"value {value_repr(value)}", ) if _with_notes else ()
+def _is_union(type_descr) -> bool:
+    # `int | str` and `typing.Union[int, str]` (or `typing.Optional[int]`) are validated the same way
+    return type(type_descr) is types.UnionType or getattr(type_descr, "__origin__", None) is typing.Union
+
+
+def _is_plain_class(type_descr) -> bool:
+    # typing.Any is a class since python 3.11, but it can not be used with isinstance
+    return isinstance(type_descr, type) and type_descr is not typing.Any
+
+
+def _plain_class(type_descr) -> type | tuple[type, ...] | None:
+    """
+    Return class if type description is a plain class (generics are not classes)
+    or tuple of classes if it's a union of plain classes, so values can be checked by isinstance.
+    """
+    if _is_plain_class(type_descr):
+        return type_descr
+    if _is_union(type_descr) and all(map(_is_plain_class, type_descr.__args__)):
+        return type_descr.__args__
+    return None
+
+
+@cache_by_id(maxsize=1024)
+def _compile_validator(type_descr) -> TypeValidator:
+    """
+    Build validator of given type description, type introspection is done only once per type description.
+
+    Type descriptions are cached by identity: equal unions (`int | str` and `str | int`) produce different messages.
+    """
     if type_descr is None:
-        if value is not None:
-            return add_exception_notes(TypeError(f"expect None"), *notes)
-        return None
+        return _validate_none
 
     if type_descr is Ellipsis or type_descr is typing.Any:
-        return None
+        return _validate_any
 
-    origin = typing.get_origin(type_descr)
-    if origin is types.UnionType:
-        args = typing.get_args(type_descr)
+    if _is_union(type_descr):
+        args = type_descr.__args__
         assert args, "expect at least one argument for union"
-        exc_list = [validate_type(value, i, _with_notes=False) for i in args]
-        if any(i is None for i in exc_list):
-            return None
-        return add_exception_notes(ExceptionGroup(f"expect {type_descr}", exc_list), *notes)
+        classes = _plain_class(type_descr)
+        return functools.partial(
+            _validate_union, type_descr, _exact_types(classes), classes, tuple(_compile_validator(i) for i in args)
+        )
+    # direct read of alias attributes, classes are never generic aliases
+    origin = None if isinstance(type_descr, type) else getattr(type_descr, "__origin__", None)
     if origin is not None:
+        args = type_descr.__args__
         if origin is list:
-            return _validate_list(value, typing.get_args(type_descr))
+            assert len(args) == 1, "Expect only one element in list specification"
+            item_class = _plain_class(args[0])
+            return functools.partial(
+                _validate_list, args[0], _exact_types(item_class), item_class, _compile_validator(args[0])
+            )
         if origin is set:
-            return _validate_set(value, typing.get_args(type_descr))
+            assert len(args) == 1, "Expect only one element in set specification"
+            item_class = _plain_class(args[0])
+            return functools.partial(
+                _validate_set, args[0], _exact_types(item_class), item_class, _compile_validator(args[0])
+            )
         if origin is tuple:
-            return _validate_tuple(value, typing.get_args(type_descr))
+            if args == ():
+                return _validate_empty_tuple
+            if args[-1] is Ellipsis:
+                assert len(args) == 2, "Expect one type in tuple specification with ellipsis"
+                item_class = _plain_class(args[0])
+                return functools.partial(
+                    _validate_tuple, args, _exact_types(item_class), item_class, (_compile_validator(args[0]), )
+                )
+            item_classes = tuple(_plain_class(i) for i in args)
+            return functools.partial(
+                _validate_tuple, args, None, item_classes if None not in item_classes else None,
+                tuple(_compile_validator(i) for i in args),
+            )
         raise AssertionError(f"generic {type_str(type_descr)} not supported")
     assert isinstance(type_descr, type), f"Unexpected type {type_descr}"
-    if not isinstance(value, type_descr):
-        return add_exception_notes(
-            TypeError(f"expect {type_descr.__name__}, got {type(value).__name__ if value is not None else None}"),
-            *notes,
-        )
-    return None
+    return functools.partial(_validate_class, type_descr)
+
+
+def compile_validator(type_descr) -> typing.Callable[[typing.Any], Exception | None]:
+    """
+    Get validator of given type description, validator is built once and reused.
+
+    :param type_descr: type description as class or type hints
+    :return: function that returns exception if value does not match type description, otherwise None
+    """
+    return _compile_validator(type_descr)
+
+
+def validate_type(value, type_descr, _with_notes: bool = True) -> Exception | None:
+    logger.debug("Validate type %s", type_descr)
+    return _compile_validator(type_descr)(value, _with_notes)
@@ -1,34 +1,55 @@
 import abc
+import concurrent.futures
 import dataclasses
+import functools
 import logging
+import operator
 import re as re_module
+import threading
+import types
 import typing
 
 from .utils.attrs import get_deep_attr
 from .utils.exceptions import add_exception_notes, ExceptionCollector
-from .utils.repr import value_repr, log_value_repr, type_str
-from .utils.type_validation import validate_type
+from .utils.repr import value_repr, LazyValueRepr, type_str
+from .utils.type_validation import compile_validator
 
 logger = logging.getLogger(__name__)
 
 
 VALIDATORS_ATTRS = "_data_class_proc_validators"
+VALIDATOR_PLAN_ATTR = "__validator_plan__"
+FIELDS_VALIDATOR_ATTR = "__fields_validator__"
+VALIDATOR_DUMP_ATTR = "__validator_dump__"
 
 
 
 class Validator(abc.ABC):
+    __slots__ = ()
 
     def update_validator_list(self, validator_list: list["Validator"]) -> list["Validator"]:
-        return validator_list + [self]
+        """
+        Add validator to the list of field validators, the list is updated in place.
+
+        :return: list of validators of the field
+        """
+        validator_list.append(self)
+        return validator_list
 
     @abc.abstractmethod
     def check_value(self, value, instance) -> Exception | None:
         ...
 
+    def checker(self) -> typing.Callable[[typing.Any, typing.Any], Exception | None]:
+        """
+        Get function that is used instead of `check_value` to validate fields.
+        It's called once the dataclass is created, so the check can be specialized.
+        """
+        return self.check_value
+
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SimpleValidator(Validator):
-    __slots__ = ("operator", "message", "skip_none")
     operator: typing.Callable[[...], bool]
     message: str
     skip_none: bool
@@ -42,14 +63,30 @@ class SimpleValidator(Validator):
     def check_value(self, value, instance):
         if value is None and self.skip_none:
             return None
+        return self._check_value(value, instance)
+
+    def checker(self):
+        # skip_none is fixed on creation, so the check is chosen once
+        return self._check_value_skip_none if self.skip_none else self._check_value
+
+    def _check_value_skip_none(self, value, instance):
+        if value is None:
+            return None
+        if self.operator(value):
+            return None
+        return self._error(value)
+
+    def _check_value(self, value, instance):
         if self.operator(value):
             return None
+        return self._error(value)
+
+    def _error(self, value) -> Exception:
         return add_exception_notes(ValueError(f"Expect {self.message}"), f"value {value_repr(value)}")
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DependValidator(Validator):
-    __slots__ = ("path", "operator", "message", "skip_none")
     path: str | dataclasses.Field
     operator: typing.Callable[[..., ...], bool]
     message: str
@@ -64,9 +101,29 @@ class DependValidator(Validator):
     def check_value(self, value, instance):
         if value is None and self.skip_none:
             return None
+        return self._check_value(*self._resolve_path(), value, instance)
 
-        path = self.path.name if isinstance(self.path, dataclasses.Field) else self.path
-        check_value = get_deep_attr(instance, path)
+    def checker(self):
+        # skip_none is fixed on creation and field has a name once dataclass is created
+        check = self._check_value_skip_none if self.skip_none else self._check_value
+        return functools.partial(check, *self._resolve_path())
+
+    def _resolve_path(self) -> tuple[str, typing.Callable[[typing.Any], typing.Any]]:
+        """
+        Get path and function that returns the value of path from instance.
+        """
+        if isinstance(self.path, dataclasses.Field):
+            # field is an attribute of the instance, it's got by C-level getter
+            return self.path.name, operator.attrgetter(self.path.name)
+        return self.path, functools.partial(get_deep_attr, path=self.path)
+
+    def _check_value_skip_none(self, path: str, getter: typing.Callable[[typing.Any], typing.Any], value, instance):
+        if value is None:
+            return None
+        return self._check_value(path, getter, value, instance)
+
+    def _check_value(self, path: str, getter: typing.Callable[[typing.Any], typing.Any], value, instance):
+        check_value = getter(instance)
         if self.operator(value, check_value):
             return None
         return add_exception_notes(
@@ -76,12 +133,19 @@ class DependValidator(Validator):
 
 
 class FieldWithValidator(dataclasses.Field):
-    __slots__ = ("validator", )
+    """
+    Field with validators, `>>` creates a new field and copies the list of validators once,
+    operands are not changed, so a validator field can be reused in several fields.
+    """
+    __slots__ = ("validator", "validators")
 
     validator: Validator
+    validators: list[Validator]
 
     def __init__(self, validator: Validator):
-        metadata = {VALIDATORS_ATTRS: [validator]}
+        # metadata refers to the list, so validators of the field are visible for dataclass
+        self.validators = [validator]
+        metadata = {VALIDATORS_ATTRS: self.validators}
         # noinspection PyTypeChecker
         super().__init__(
             default=dataclasses.MISSING, default_factory=dataclasses.MISSING,
@@ -89,61 +153,359 @@ class FieldWithValidator(dataclasses.Field):
         )
         self.validator = validator
 
+    def _copy(self, source: dataclasses.Field, validators: list[Validator]) -> "FieldWithValidator":
+        """
+        Create field with properties of source field and given validators.
+        """
+        field = object.__new__(FieldWithValidator)
+        for attr in dataclasses.Field.__slots__:
+            setattr(field, attr, getattr(source, attr))
+        field.validator = self.validator
+        field.validators = validators
+        field.metadata = types.MappingProxyType({**source.metadata, VALIDATORS_ATTRS: validators})
+        return field
+
     def __rrshift__(self, other) -> dataclasses.Field:
 
         if not isinstance(other, dataclasses.Field):
             # we try to append validator to value that is default value of field
             assert self.default is dataclasses.MISSING, "Validator is used as a field with a default value"
-            self.default = other
-            return self
+            field = self._copy(self, list(self.validators))
+            field.default = other
+            return field
 
         assert not isinstance(other, FieldWithValidator), "Standard rshift must be applied"
-        assert self.metadata == {VALIDATORS_ATTRS: [self.validator]}, "Validator metadata was affected"
-        metadata = {
-            **other.metadata,
-            VALIDATORS_ATTRS: self.validator.update_validator_list(other.metadata.get(VALIDATORS_ATTRS, []))
-        }
-
-        return dataclasses.Field(
-            default=other.default, default_factory=other.default_factory,
-            init=other.init, repr=other.repr, hash=other.repr, compare=other.compare,
-            metadata=metadata, kw_only=other.kw_only
-        )
+        assert self.metadata[VALIDATORS_ATTRS] is self.validators, "Validator metadata was affected"
+        assert self.default is dataclasses.MISSING, "Validator is used as a field with a default value"
+        # validators of the field are applied first, other properties are taken from the field
+        validators = list(other.metadata.get(VALIDATORS_ATTRS, ()))
+        for validator in self.validators:
+            validators = validator.update_validator_list(validators)
+        return self._copy(other, validators)
 
     def __rshift__(self, other: dataclasses.Field) -> dataclasses.Field:
         if not isinstance(other, FieldWithValidator):
-            raise NotImplemented
+            return NotImplemented
+
+        assert self.metadata[VALIDATORS_ATTRS] is self.validators, "Validator metadata was affected"
+        assert other.metadata[VALIDATORS_ATTRS] is other.validators, "Validator metadata was affected"
+
+        validators = list(self.validators)
+        for validator in other.validators:
+            validators = validator.update_validator_list(validators)
+        field = self._copy(self, validators)
+        if other.default is not dataclasses.MISSING:
+            assert self.default is dataclasses.MISSING, "Field has several default values"
+            field.default = other.default
+        return field
+
+
+# how nested dataclasses are found in a field value, flags are combined
+_TRAVERSE_NONE = 0
+_TRAVERSE_SELF = 1
+_TRAVERSE_MAPPING = 2
+_TRAVERSE_COLLECTION = 4
+
+# items of strings are strings, there is no need to look for nested dataclasses
+_NOT_TRAVERSED_TYPES = (str, bytes, bytearray)
+
+
+# how items of a collection are checked for nested dataclasses, it's known from declared type of field
+_ITEMS_DYNAMIC = 0
+_ITEMS_SKIP = 1
+_ITEMS_ALWAYS = 2
+
+# builtin types that are not mixed with dataclasses with validators
+_SCALAR_TYPES = frozenset((int, float, complex, bool, str, bytes, type(None)))
+
+
+@functools.lru_cache(maxsize=1024)
+def _traversal_kind(value_type: type) -> int:
+    # isinstance against typing.Mapping/Collection is slow and it depends only on the type of value,
+    # declared type of field is not enough as a value may be an instance of its subclass
+    kind = _TRAVERSE_SELF if issubclass(value_type, ValidatorMixin) else _TRAVERSE_NONE
+    if value_type in _NOT_TRAVERSED_TYPES:
+        return kind
+    if issubclass(value_type, typing.Mapping):
+        return kind | _TRAVERSE_MAPPING
+    if issubclass(value_type, typing.Collection):
+        return kind | _TRAVERSE_COLLECTION
+    return kind
+
+
+def _items_kind(type_descr) -> int:
+    """
+    Get how items of a collection field are traversed, value of field is traversed after type validation,
+    so items are instances of declared item types.
+    """
+    if typing.get_origin(type_descr) not in (list, set, tuple):
+        return _ITEMS_DYNAMIC
+    item_types = []
+    for arg in typing.get_args(type_descr):
+        if arg is Ellipsis:
+            continue
+        if typing.get_origin(arg) in (typing.Union, types.UnionType):
+            item_types.extend(typing.get_args(arg))
+        else:
+            item_types.append(arg)
+    if all(i is None or i in _SCALAR_TYPES for i in item_types):
+        return _ITEMS_SKIP
+    if all(isinstance(i, type) and issubclass(i, ValidatorMixin) for i in item_types):
+        return _ITEMS_ALWAYS
+    return _ITEMS_DYNAMIC
+
+
+def _collect(exc_collector: ExceptionCollector | None, exc: Exception, *notes: str) -> ExceptionCollector:
+    """
+    Add exception to collector, collector is created on the first exception as success is the common case.
+    """
+    if exc_collector is None:
+        exc_collector = ExceptionCollector()
+    return exc_collector.add(exc, *notes)
+
+
+def _collect_raised(exc_collector: ExceptionCollector | None, exc: Exception, *notes: str) -> ExceptionCollector:
+    """
+    Same as `_collect` but exception is added as if it was raised inside collector context.
+    """
+    if exc_collector is None:
+        exc_collector = ExceptionCollector()
+    return exc_collector.add_raised(exc, *notes)
+
+
+def _validate_nested(exc_collector: ExceptionCollector | None, value: "ValidatorMixin",
+                     *notes: str) -> ExceptionCollector | None:
+    """
+    Validate nested dataclass, exceptions raised by its validators are collected as returned ones.
+    """
+    try:
+        exc = value._full_validate_exception()
+    except (ValueError, TypeError, ExceptionGroup) as raised_exc:
+        exc = raised_exc
+    if exc is None:
+        return exc_collector
+    return _collect_raised(exc_collector, exc, *notes)
+
+
+def _validate_mapping_items(name: str, field_value: typing.Mapping, exc_collector: ExceptionCollector | None,
+                            is_debug: bool) -> ExceptionCollector | None:
+    if is_debug:
+        logger.debug("Field %s has a dict", name)
+    for key, item in field_value.items():
+        if not isinstance(item, ValidatorMixin):
+            continue
+        if is_debug:
+            logger.debug("Value of key %s of field %s has a validator", key, name)
+        exc_collector = _validate_nested(exc_collector, item, f"key {key}")
+    return exc_collector
+
+
+def _validate_children(self, name: str, field_value, exc_collector: ExceptionCollector | None,
+                       items_kind: int, is_debug: bool) -> ExceptionCollector | None:
+    """
+    Run validation of nested dataclasses in field value.
 
-        other = typing.cast(FieldWithValidator, other)
-        assert self.metadata == {VALIDATORS_ATTRS: [self.validator]}, "Validator metadata was affected"
-        assert other.metadata == {VALIDATORS_ATTRS: [other.validator]}, "Validator metadata was affected"
+    :return: collector with added exceptions, it's created if there was no collector
+    """
+    kind = _traversal_kind(type(field_value))
+    if kind == _TRAVERSE_NONE:
+        return exc_collector
+
+    if kind & _TRAVERSE_SELF:
+        if is_debug:
+            logger.debug("Field %s has a value that has validator", name)
+        exc_collector = _validate_nested(exc_collector, field_value)
+
+    if kind & _TRAVERSE_MAPPING:
+        exc_collector = _validate_mapping_items(name, field_value, exc_collector, is_debug)
+    elif kind & _TRAVERSE_COLLECTION and items_kind != _ITEMS_SKIP:
+        for idx, item in enumerate(field_value):
+            # items of declared dataclass types are not checked
+            if items_kind == _ITEMS_DYNAMIC and not isinstance(item, ValidatorMixin):
+                continue
+            if is_debug:
+                logger.debug("Value with index %s of field %s has a validator", idx, name)
+            exc_collector = _validate_nested(exc_collector, item, f"index {idx}")
+    return exc_collector
+
+
+def _build_function(name: str, lines: list[str], namespace: dict[str, typing.Any]) -> typing.Callable:
+    source = "\n".join(lines)
+    logger.debug("Generated %s:\n%s", name, source)
+    exec(compile(source, f"<dataclasses_mod {name}>", "exec"), namespace)
+    return namespace[name]
 
-        metadata = {
-            VALIDATORS_ATTRS: self.validator.update_validator_list([other.validator])
-        }
 
-        return dataclasses.Field(
-            default=other.default, default_factory=other.default_factory,
-            init=other.init, repr=other.repr, hash=other.repr, compare=other.compare,
-            metadata=metadata, kw_only=other.kw_only
+def _build_field_validator(field: dataclasses.Field) -> typing.Callable[[typing.Any, bool], Exception | None]:
+    """
+    Generate validation function of a field with unrolled validators.
+
+    :return: function that accepts an instance and flag of debug logging, returns exception of the field or None
+    """
+    name = field.name
+    validators = tuple(field.metadata.get(VALIDATORS_ATTRS, ()))
+    items_kind = _items_kind(field.type)
+    namespace = {
+        "logger": logger,
+        "collect": _collect,
+        "validate_children": _validate_children,
+        "type_validator": compile_validator(field.type),
+    }
+    # debug messages are skipped by a check of local flag, arguments are not evaluated
+    lines = [
+        "def validate_field(self, is_debug):",
+        f"    field_value = self.{name}",
+        f"    if is_debug: logger.debug('Validate field %s', {name!r})",
+        f"    if is_debug: logger.debug('Check type of field %s', {name!r})",
+        "    exc = type_validator(field_value)",
+        "    if exc is not None:",
+        "        if is_debug: logger.debug('Type validation failed, return error')",
+        "        return collect(None, exc).single_or_group_exception('Field type errors')",
+        "    exc_collector = None",
+        f"    if is_debug: logger.debug('Run field validators for %s', {name!r})",
+    ]
+    for idx, validator in enumerate(validators):
+        namespace[f"validator_{idx}"] = validator
+        namespace[f"check_value_{idx}"] = validator.checker()
+        lines += [
+            f"    if is_debug: logger.debug('Validate %s with %s', {name!r}, validator_{idx})",
+            f"    exc = check_value_{idx}(field_value, self)",
+            "    if exc is not None: exc_collector = collect(exc_collector, exc)",
+        ]
+    lines += [
+        f"    exc_collector = validate_children(self, {name!r}, field_value, exc_collector, {items_kind}, is_debug)",
+        "    if is_debug:",
+        "        exc_count = len(exc_collector.exc_list) if exc_collector is not None else 0",
+        f"        logger.debug('Validation of %s finished with %s exceptions', {name!r}, exc_count)",
+        "    if exc_collector is None:",
+        "        return None",
+        "    return exc_collector.single_or_group_exception('Field validation errors')",
+    ]
+    return _build_function("validate_field", lines, namespace)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _FieldPlan:
+    """
+    Everything that is required to validate a field, it's collected once per class.
+    """
+    name: str
+    type: typing.Any
+    validators: tuple[Validator, ...]
+    validate: typing.Callable[[typing.Any, bool], Exception | None]
+    # note of field exceptions
+    note: str
+
+    @classmethod
+    def from_field(cls, field: dataclasses.Field) -> "_FieldPlan":
+        return cls(
+            name=field.name,
+            type=field.type,
+            validators=tuple(field.metadata.get(VALIDATORS_ATTRS, ())),
+            validate=_build_field_validator(field),
+            note=f"field {field.name}",
         )
 
 
+def _build_fields_validator(
+        plan: tuple[_FieldPlan, ...]
+) -> typing.Callable[[typing.Any, bool], ExceptionCollector | None]:
+    """
+    Generate validation function of all fields of a class without a loop over fields.
+
+    :return: function that accepts an instance and flag of debug logging,
+        returns collector of exceptions or None if there are no exceptions
+    """
+    namespace = {"collect": _collect}
+    lines = [
+        "def validate_fields(self, is_debug):",
+        "    exc_collector = None",
+    ]
+    for idx, field in enumerate(plan):
+        namespace[f"validate_{idx}"] = field.validate
+        lines += [
+            f"    exc = validate_{idx}(self, is_debug)",
+            f"    if exc is not None: exc_collector = collect(exc_collector, exc, {field.note!r})",
+        ]
+    lines.append("    return exc_collector")
+    return _build_function("validate_fields", lines, namespace)
+
+
+_executor: concurrent.futures.ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+# threads of the pool are marked, validation inside them is sequential,
+# otherwise workers wait for tasks that are queued behind them
+_thread_state = threading.local()
+
+
+def _mark_pool_thread():
+    _thread_state.is_pool_thread = True
+
+
+def _in_pool_thread() -> bool:
+    return getattr(_thread_state, "is_pool_thread", False)
+
+
+def _get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """
+    Get thread pool of parallel validation, it's created on first use.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = concurrent.futures.ThreadPoolExecutor(
+                    thread_name_prefix="dataclasses_mod", initializer=_mark_pool_thread
+                )
+    return _executor
+
+
 class ValidatorMixin:
     """
     Mixin that allows to run validation on dataclasses
     """
 
+    @classmethod
+    def _validator_plan(cls) -> tuple[_FieldPlan, ...]:
+        """
+        Get validation plan of fields.
+
+        The plan is built on first use as fields are defined by dataclass decorator after class creation.
+        """
+        plan = cls.__dict__.get(VALIDATOR_PLAN_ATTR)
+        if plan is None:
+            plan = tuple(_FieldPlan.from_field(i) for i in dataclasses.fields(cls))  # noqa
+            setattr(cls, VALIDATOR_PLAN_ATTR, plan)
+        return plan
+
+    @classmethod
+    def _fields_validator(cls) -> typing.Callable[[typing.Any, bool], ExceptionCollector | None]:
+        """
+        Get function that validates all fields of the class, it's generated once per class.
+        """
+        impl = cls.__dict__.get(FIELDS_VALIDATOR_ATTR)
+        if impl is None:
+            impl = _build_fields_validator(cls._validator_plan())
+            setattr(cls, FIELDS_VALIDATOR_ATTR, impl)
+        return impl
+
     @classmethod
     def dump_validators(cls):
-        result = []
+        dump = cls.__dict__.get(VALIDATOR_DUMP_ATTR)
+        if dump is not None:
+            return dump
+        lines = []
+        # dump is rendered from fields, validators are not built, so unsupported types are still dumped
         for field in dataclasses.fields(cls):  # noqa
-            validator_list = field.metadata.get(VALIDATORS_ATTRS, [])
+            validator_list = field.metadata.get(VALIDATORS_ATTRS, ())
             if not validator_list:
                 continue
-            v_repr = [f"validate type {type_str(field.type)}"] + [str(i) for i in validator_list]
-            result.append(f"\t{field.name}: " + ", ".join(v_repr))
-        return f"validators for {type_str(cls)}:\n" + "\n".join(result)
+            v_repr = [f"validate type {type_str(field.type)}"]
+            v_repr.extend(str(i) for i in validator_list)
+            lines.append(f"\t{field.name}: {', '.join(v_repr)}")
+        dump = f"validators for {type_str(cls)}:\n" + "\n".join(lines)
+        setattr(cls, VALIDATOR_DUMP_ATTR, dump)
+        return dump
 
 
     def validate(self):
@@ -153,72 +515,64 @@ class ValidatorMixin:
         pass
 
     @typing.final
-    def full_validate(self):
-        """Run full validation of dataclasses"""
+    def full_validate(self, *, parallel: bool = False):
+        """
+        Run full validation of dataclasses
 
-        logger.info("Validate %s", log_value_repr(self, logging.INFO, logger))
-        assert dataclasses.is_dataclass(self), f"{value_repr(self)} if not a dataclass"
+        :param parallel: validate fields in threads, it helps only if validators wait for I/O,
+            nested dataclasses are validated in the same thread as their field,
+            custom validation of the instance runs in the calling thread,
+            validation that is already run in a thread of the pool is sequential
+        """
+        exc = self._full_validate_exception(parallel)
+        if exc is not None:
+            raise exc
 
-        exc_collector = ExceptionCollector()
+    @typing.final
+    def _full_validate_exception(self, parallel: bool = False) -> Exception | None:
+        """
+        Run full validation of dataclasses and return exception instead of raising it,
+        nested dataclasses are validated without raise and catch of their exceptions.
+        """
+        # rendered once and only if a message is emitted, debug messages are enabled only if info ones are
+        self_repr = LazyValueRepr(self, logging.INFO, logger)
+        logger.info("Validate %s", self_repr)
+        assert dataclasses.is_dataclass(self), f"{value_repr(self)} if not a dataclass"
+        # level is checked once, generated validators skip debug messages by the flag
+        is_debug = logger.isEnabledFor(logging.DEBUG)
 
-        for item in dataclasses.fields(self):   # noqa
-            exc_collector.add(add_exception_notes(self._validate_field(item)), f"field {item.name}")
+        if parallel and len(self._validator_plan()) > 1 and not _in_pool_thread():
+            exc_collector = self._validate_fields_parallel(is_debug)
+        else:
+            exc_collector = self._fields_validator()(self, is_debug)
 
-        with exc_collector():
-            logger.debug("Run custom validator of %s", log_value_repr(self, logging.DEBUG, logger))
+        if is_debug:
+            logger.debug("Run custom validator of %s", self_repr)
+        try:
             self.validate()
+        except (ValueError, TypeError, ExceptionGroup) as exc:
+            exc_collector = _collect_raised(exc_collector, exc)
 
-        logger.debug("Validation of %s finished with %s exceptions",
-                     log_value_repr(self, logging.INFO, logger), len(exc_collector.exc_list))
+        if is_debug:
+            exc_count = len(exc_collector.exc_list) if exc_collector is not None else 0
+            logger.debug("Validation of %s finished with %s exceptions", self_repr, exc_count)
 
-        exc = exc_collector.single_or_group_exception("Validation errors")
-        if exc is not None:
-            raise exc
+        if exc_collector is None:
+            return None
+        return exc_collector.single_or_group_exception("Validation errors")
 
     @typing.final
-    def _validate_field(self, field: dataclasses.Field) -> Exception | None:
-        field_value = getattr(self, field.name)
-        logger.debug("Validate field %s", field.name)
-
-        validator_metadata = typing.cast(list[Validator], field.metadata.get(VALIDATORS_ATTRS, []))
-
-        exc_collector = ExceptionCollector()
-
-        logger.debug("Check type of field %s", field.name)
-        exc_collector.add(validate_type(field_value, field.type))
-
-        if exc_collector.exc_list:
-            logger.debug("Type validation failed, return error")
-            return exc_collector.single_or_group_exception("Field type errors")
-
-        logger.debug("Run field validators for %s", field.name)
-        for validator in validator_metadata:
-            logger.debug("Validate %s with %s", field.name, validator)
-            exc_collector.add(validator.check_value(field_value, self))
-
-        if isinstance(field_value, ValidatorMixin):
-            logger.debug("Field %s has a value that has validator", field.name)
-            with exc_collector():
-                field_value.full_validate()
-
-        if isinstance(field_value, typing.Mapping):
-            logger.debug("Field %s has a dict", field.name)
-            for key, item in field_value.items():
-                if not isinstance(item, ValidatorMixin):
-                    continue
-                with exc_collector(f"key {key}"):
-                    logger.debug("Value of key %s of field %s has a validator", key, field.name)
-                    item.full_validate()
-        elif isinstance(field_value, typing.Collection):
-            for idx, item in enumerate(field_value):
-                if not isinstance(item, ValidatorMixin):
-                    continue
-                with exc_collector(f"index {idx}"):
-                    logger.debug("Value with index %s of field %s has a validator", idx, field.name)
-                    item.full_validate()
-
-        logger.debug("Validation of %s finished with %s exceptions", field.name, len(exc_collector.exc_list))
-        return exc_collector.single_or_group_exception("Field validation errors")
+    def _validate_fields_parallel(self, is_debug: bool) -> ExceptionCollector | None:
+        executor = _get_executor()
+        plan = self._validator_plan()
+        futures = [executor.submit(field.validate, self, is_debug) for field in plan]
+        exc_collector = None
+        # results are collected in the order of fields, so exceptions are the same as in sequential validation
+        for field, future in zip(plan, futures):
+            exc = future.result()
+            if exc is not None:
+                exc_collector = _collect(exc_collector, exc, field.note)
+        return exc_collector
 
 
 def eq(field: dataclasses.Field | str) -> FieldWithValidator:
@@ -286,12 +640,25 @@ def re(reg_exp: typing.Pattern | str) -> FieldWithValidator:
             reg_exp = reg_exp + "$"
         reg_exp = re_module.compile(reg_exp)
     pattern = reg_exp.pattern.lstrip("^").rstrip("$")
-    return FieldWithValidator(SimpleValidator(lambda v: reg_exp.match(v) is not None,
-                                              f"regular expression `{pattern}`", True))
+    # match object is always true, so bound method is used as operator without a wrapper
+    return FieldWithValidator(SimpleValidator(reg_exp.match, f"regular expression `{pattern}`", True))
 
 
 def values(*expected_values) -> FieldWithValidator:
     """
     Check if value is in the provided list
     """
-    return FieldWithValidator(SimpleValidator(lambda v: v in expected_values, f"values {expected_values}", True))
+    try:
+        lookup = frozenset(expected_values)
+    except TypeError:
+        # unhashable expected values are compared one by one
+        return FieldWithValidator(SimpleValidator(expected_values.__contains__, f"values {expected_values}", True))
+
+    def is_expected(v) -> bool:
+        try:
+            return v in lookup
+        except TypeError:
+            # unhashable value can still be equal to one of expected values
+            return v in expected_values
+
+    return FieldWithValidator(SimpleValidator(is_expected, f"values {expected_values}", True))
@@ -70,6 +70,14 @@ def test_check_same_fields_fail(schema, file_regression):
     file_regression.check(str(exc_info.value))
 
 
+def test_check_same_fields_changed_schema():
+    schema = ["a"]
+    base.check_same_fields(cmp, schema)
+    schema.append("b")
+    with pytest.raises(ValueError):
+        base.check_same_fields(cmp, schema)
+
+
 
 def test_check_another_fields_success():
     base.check_another_fields(cmp, {
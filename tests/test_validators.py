@@ -132,3 +132,140 @@ class TestConstrainsValidation(Base):
         with pytest.raises(Exception) as exc_info:
             Constrains(*args).full_validate()
         self.data_regression.check(serialize_exception(exc_info.value))
+
+    def test_chain(self):
+        assert Constrains([1], "aa").c == 10
+        assert Constrains([1], "aa").d == ""
+        assert Constrains.dump_validators().splitlines()[3] == (
+            "\tc: validate type int, validate min value 10, validate max value 20"
+        )
+
+    def test_dump_unsupported_type(self):
+        @dataclasses.dataclass
+        class Unsupported(ValidatorMixin):
+            x: dict[str, int] = v.min_length(1)
+            y: "int" = v.min(0)
+
+        assert Unsupported.dump_validators().splitlines()[1:] == [
+            "\tx: validate type dict[str, int], validate min length 1",
+            "\ty: validate type int, validate min value 0",
+        ]
+
+    def test_reuse(self):
+        positive = v.min(0)
+
+        @dataclasses.dataclass
+        class Reuse(ValidatorMixin):
+            a: int = positive >> v.max(10)
+            b: int = positive >> v.max(5)
+            c: int = dataclasses.field(default=1) >> positive
+            d: int = dataclasses.field(default=2) >> positive
+
+        assert Reuse(a=7, b=3).full_validate() is None
+        assert (Reuse(a=7, b=3).c, Reuse(a=7, b=3).d) == (1, 2)
+        with pytest.raises(Exception):
+            Reuse(a=7, b=7).full_validate()
+        assert positive.validators == [positive.validator]
+
+
+@dataclasses.dataclass
+class Item(ValidatorMixin):
+    a: int = v.min(0)
+
+
+@dataclasses.dataclass
+class NestedTypes(ValidatorMixin):
+    a: Item
+    b: list[Item]
+    c: dict | None = None
+    d: str = "aa"
+
+
+@dataclasses.dataclass
+class RaisingItem(ValidatorMixin):
+    # regular expression raises TypeError for int
+    name: str | int = v.re("a+")
+
+
+@dataclasses.dataclass
+class NestedRaising(ValidatorMixin):
+    item: RaisingItem
+    items: list[RaisingItem]
+    n: int = v.min(0)
+
+
+class TestNestedValidation(Base):
+
+    @pytest.mark.parametrize("args", (
+            (Item(1), [], None),
+            (Item(1), [Item(1), Item(2)], {"x": Item(1)}),
+    ))
+    def test_valid(self, args):
+        NestedTypes(*args).full_validate()
+
+    @pytest.mark.parametrize("args", (
+            (Item(-1), [Item(1)], None),
+            (Item(1), [Item(1), Item(-2)], None),
+            (Item(1), [], {"x": Item(-1), "y": Item(1)}),
+            (Item(-1), [Item(-1), Item(-2)], {"x": Item(-3)}),
+    ))
+    def test_nested_fail(self, args):
+        with pytest.raises(Exception) as exc_info:
+            NestedTypes(*args).full_validate()
+        self.data_regression.check(serialize_exception(exc_info.value))
+
+    def test_nested_raise(self):
+        with pytest.raises(Exception) as exc_info:
+            NestedRaising(RaisingItem(5), [RaisingItem("a"), RaisingItem(6)], -1).full_validate()
+        self.data_regression.check(serialize_exception(exc_info.value))
+
+    def test_parallel(self):
+        value = NestedTypes(Item(-1), [Item(-1), Item(-2)], {"x": Item(-3)})
+        with pytest.raises(Exception) as exc_info:
+            value.full_validate()
+        with pytest.raises(Exception) as parallel_exc_info:
+            value.full_validate(parallel=True)
+        assert serialize_exception(parallel_exc_info.value) == serialize_exception(exc_info.value)
+
+    def test_parallel_nested(self):
+        # more fields than threads of the pool, each field runs parallel validation of a nested dataclass
+        @dataclasses.dataclass
+        class Mid(ValidatorMixin):
+            leaf: NestedTypes
+
+            def validate(self):
+                self.leaf.full_validate(parallel=True)
+
+        Outer = dataclasses.make_dataclass(
+            "Outer", [(f"f{i}", Mid) for i in range(64)], bases=(ValidatorMixin, )
+        )
+        leaf = NestedTypes(Item(1), [Item(2)], {"x": Item(-1)})
+        with pytest.raises(Exception) as exc_info:
+            Outer(*(Mid(leaf) for _ in range(64))).full_validate(parallel=True)
+        assert len(exc_info.value.exceptions) == 64
+
+
+@dataclasses.dataclass
+class Values(ValidatorMixin):
+    a: int | list[int] = v.values(1, 2)
+    b: list[int] | None = v.values([1], [2, 3])
+
+
+class TestValuesValidation(Base):
+
+    @pytest.mark.parametrize("args", (
+            (1, [1]),
+            (2, [2, 3]),
+            (2, None),
+    ))
+    def test_valid(self, args):
+        Values(*args).full_validate()
+
+    @pytest.mark.parametrize("args", (
+            (3, [1]),
+            ([1], [1]),
+            (1, [2]),
+    ))
+    def test_values_fail(self, args):
+        with pytest.raises(ValueError, match=r"^Expect values"):
+            Values(*args).full_validate()
@@ -0,0 +1,44 @@
+import pytest
+
+from dataclasses_mod.utils.attrs import get_deep_attr, get_deep_attrs
+
+
+class Sub:
+    a = 1
+    b = {"c": [10, 20, {"d": "foo"}]}
+
+
+class Root:
+    s = Sub()
+    t = (Sub(), )
+
+
+ROOT = Root()
+
+
+@pytest.mark.parametrize("path, expected", (
+    (".", ROOT),
+    ("", ROOT),
+    ("s.a", 1),
+    ("s.b.c.1", 20),
+    ("s.b.c.2.d", "foo"),
+    ("t.0.a", 1),
+))
+def test_get_deep_attr(path, expected):
+    assert get_deep_attr(ROOT, path) is expected
+
+
+@pytest.mark.parametrize("path, message", (
+    ("s.x", r"^Expect attribute x of path s.x but not found in "),
+    ("s.b.c.x", r"^Expect int as index, got \[.*\] in path s.b.c.x$"),
+    ("s.b.c.5", r"^Out of index of path s.b.c.5$"),
+    ("s..a", r"^Empty element in path s..a$"),
+))
+def test_get_deep_attr_fail(path, message):
+    with pytest.raises(AssertionError, match=message):
+        get_deep_attr(ROOT, path)
+
+
+def test_get_deep_attrs():
+    paths = ("s.a", "s.b.c.0", ".", "s.b.c.2.d", "t.0.a")
+    assert get_deep_attrs(ROOT, paths) == [get_deep_attr(ROOT, i) for i in paths]
@@ -1,6 +1,6 @@
 import typing
 
-from dataclasses_mod.utils.type_validation import validate_type
+from dataclasses_mod.utils.type_validation import compile_validator
 from ..common import serialize_exception, Base
 
 DATA = {
@@ -33,21 +33,16 @@ DATA = {
     "tuple_list_int_set_str_or_int": ([1, 2], {1, "foo"}),
 }
 
-
-def _test(cases: dict, type_desc, data_regression):
-    result = {}
-    for key, val in cases.items():
-        result[key] = serialize_exception(validate_type(val, type_desc))
-    data_regression.check(result)
+KEYS = tuple(DATA)
+VALUES = tuple(DATA.values())
 
 
 class TestCase(Base):
 
     def _test(self, type_desc, cases: dict = None):
-        cases = cases or DATA
-        result = {}
-        for key, val in cases.items():
-            result[key] = serialize_exception(validate_type(val, type_desc))
+        keys, values = (tuple(cases), tuple(cases.values())) if cases else (KEYS, VALUES)
+        validator = compile_validator(type_desc)
+        result = dict(zip(keys, map(serialize_exception, map(validator, values))))
         self.data_regression.check(result)
 
     def test_null(self):
@@ -74,6 +69,15 @@ class TestCase(Base):
     def test_int_or_str(self):
         self._test(int | str)
 
+    def test_typing_union(self):
+        self._test(typing.Union[int, str])
+
+    def test_typing_optional(self):
+        self._test(typing.Optional[int])
+
+    def test_typing_optional_any(self):
+        self._test(typing.Optional[typing.Any])
+
     def test_list_of_int(self):
         self._test(list[int])
 
@@ -83,6 +87,12 @@ class TestCase(Base):
     def test_list_of_str_or_int(self):
         self._test(list[str | int])
 
+    def test_list_of_typing_optional_str(self):
+        self._test(list[typing.Optional[str]])
+
+    def test_list_of_typing_any(self):
+        self._test(list[typing.Any])
+
     def test_list_list(self):
         self._test(list[list])
 
@@ -101,6 +111,9 @@ class TestCase(Base):
     def test_set_of_str_or_int(self):
         self._test(set[str | int])
 
+    def test_set_of_typing_any(self):
+        self._test(set[typing.Any])
+
     def test_tuple_empty(self):
         self._test(tuple[()])
 
@@ -116,9 +129,15 @@ class TestCase(Base):
     def test_tuple_int_ellipsis(self):
         self._test(tuple[int, ...])
 
+    def test_tuple_typing_any_ellipsis(self):
+        self._test(tuple[typing.Any, ...])
+
     def test_tuple_int_str(self):
         self._test(tuple[int, str])
 
+    def test_tuple_int_typing_any(self):
+        self._test(tuple[int, typing.Any])
+
     def test_tuple_int_or_str(self):
         self._test(tuple[int | str])
 